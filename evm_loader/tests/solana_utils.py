@@ -1,9 +1,12 @@
 import base64
 import json
 import os
+import requests
+import struct
 import subprocess
 import time
 from enum import Enum
+from functools import lru_cache
 from hashlib import sha256
 from typing import NamedTuple, Tuple, Union
 
@@ -50,6 +53,10 @@ ETH_TOKEN_MINT_ID: PublicKey = PublicKey(os.environ.get("ETH_TOKEN_MINT"))
 EVM_LOADER_SO = os.environ.get("EVM_LOADER_SO", 'target/bpfel-unknown-unknown/release/evm_loader.so')
 client = Client(solana_url)
 path_to_solana = 'solana'
+# keep-alive connections for JSON-RPC batch requests sent past the solana-py provider
+rpc_session = requests.Session()
+rpc_session.mount('http://', requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=64))
+rpc_session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=64))
 
 ACCOUNT_SEED_VERSION=b'\1'
 
@@ -70,6 +77,11 @@ LAMPORTS_PER_SIGNATURE = 5000
 # account storage overhead for calculation of base rent
 ACCOUNT_STORAGE_OVERHEAD = 128
 
+# instruction tag, collateral pool index, step count
+STEP_INSTRUCTION_HEADER = struct.Struct('<B4sQ')
+# instruction tag, holder id, offset, data length
+WRITE_HOLDER_HEADER = struct.Struct('<BQIQ')
+
 DEFAULT_UNITS=500*1000
 DEFAULT_HEAP_FRAME=256*1024
 DEFAULT_ADDITIONAL_FEE=0
@@ -150,6 +162,60 @@ def confirm_transaction(http_client, tx_sig, confirmations=0):
     raise RuntimeError("could not confirm transaction: ", tx_sig)
 
 
+def send_multiple_transactions_unconfirmed(http_client, trxs, signer, opts=TxOpts(skip_preflight=True, preflight_commitment=Confirmed)):
+    """Send several transactions with a single JSON-RPC batch request, return signatures in the order of trxs."""
+    blockhash = http_client.get_recent_blockhash(Confirmed)["result"]["value"]["blockhash"]
+    batch = []
+    for (request_id, trx) in enumerate(trxs):
+        trx.recent_blockhash = blockhash
+        trx.sign(signer)
+        batch.append({
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "sendTransaction",
+            "params": [
+                base64.b64encode(trx.serialize()).decode('utf8'),
+                {"skipPreflight": opts.skip_preflight, "preflightCommitment": opts.preflight_commitment, "encoding": "base64"}
+            ]
+        })
+    response = rpc_session.post(http_client._provider.endpoint_uri, headers={"Content-Type": "application/json"}, json=batch)
+    response.raise_for_status()
+    results = {result["id"]: result for result in response.json()}
+
+    signatures = []
+    for request_id in range(len(batch)):
+        result = results[request_id]
+        if result.get("error"):
+            raise RuntimeError("could not send transaction: ", result["error"])
+        signatures.append(result["result"])
+    return signatures
+
+
+def confirm_multiple_transactions(http_client, tx_sigs, confirmations=0):
+    """Confirm several transactions polling their statuses with one getSignatureStatuses request."""
+    TIMEOUT = 30  # 30 seconds pylint: disable=invalid-name
+    elapsed_time = 0
+    pending = list(tx_sigs)
+    while elapsed_time < TIMEOUT:
+        print('confirm_multiple_transactions for %s', pending)
+        resp = http_client.get_signature_statuses(pending)
+        if resp["result"]:
+            statuses = resp['result']['value']
+            for (tx_sig, status) in zip(pending, statuses):
+                # without preflight a failed transaction is only visible here
+                if status and status['err']:
+                    raise RuntimeError("transaction failed: ", tx_sig, status['err'])
+            pending = [tx_sig for (tx_sig, status) in zip(pending, statuses)
+                       if not (status and (status['confirmationStatus'] == 'finalized' or status['confirmationStatus'] == 'confirmed'
+                                           and status['confirmations'] >= confirmations))]
+            if not pending:
+                return
+        sleep_time = 0.1
+        time.sleep(sleep_time)
+        elapsed_time += sleep_time
+    raise RuntimeError("could not confirm transactions: ", pending)
+
+
 def accountWithSeed(base, seed, program):
     # print(type(base), type(seed), type(program))
     return PublicKey(sha256(bytes(base) + bytes(seed, 'utf8') + bytes(program)).digest())
@@ -181,6 +247,34 @@ def createAccountWithSeed(funding, base, seed, lamports, space, program):
     )
 
 
+def get_multiple_accounts(http_client, accounts):
+    """Fetch accounts with getMultipleAccounts (100 per request), None stands for an absent account."""
+    result = []
+    for i in range(0, len(accounts), 100):
+        resp = http_client._provider.make_request(types.RPCMethod("getMultipleAccounts"),
+                                                  [str(account) for account in accounts[i:i+100]],
+                                                  {"commitment": Confirmed, "encoding": "base64"})
+        result += resp['result']['value']
+    return result
+
+
+def create_accounts_with_seed(http_client, acc, seeds, lamports, space, program=EVM_LOADER):
+    """Create the missing accounts with seed for the base account acc, return their addresses in the order of seeds."""
+    accounts = [accountWithSeed(acc.public_key(), seed, PublicKey(program)) for seed in seeds]
+    missing = [seed for (seed, info) in zip(seeds, get_multiple_accounts(http_client, accounts)) if info is None]
+
+    trxs = []
+    for i in range(0, len(missing), 4):
+        trx = TransactionWithComputeBudget()
+        for seed in missing[i:i+4]:
+            trx.add(createAccountWithSeed(acc.public_key(), acc.public_key(), seed, lamports, space, PublicKey(program)))
+        trxs.append(trx)
+    if trxs:
+        confirm_multiple_transactions(http_client, send_multiple_transactions_unconfirmed(http_client, trxs, acc))
+
+    return accounts
+
+
 class solana_cli:
     def __init__(self, acc=None):
         self.acc = acc
@@ -362,11 +456,10 @@ class EvmLoader:
     def ether2seed(self, ether):
         if isinstance(ether, str):
             if ether.startswith('0x'): ether = ether[2:]
-        else:
-            ether = ether.hex()
-        seed = b58encode(ACCOUNT_SEED_VERSION+bytes.fromhex(ether)).decode('utf8')
+            ether = bytes.fromhex(ether)
+        seed = b58encode(ACCOUNT_SEED_VERSION+ether).decode('utf8')
         acc = accountWithSeed(self.acc.get_acc().public_key(), seed, PublicKey(self.loader_id))
-        print('ether2program: {} {} => {}'.format(ether, 255, acc))
+        print('ether2program: {} {} => {}'.format(ether.hex(), 255, acc))
         return (acc, 255)
 
     def ether2program(self, ether):
@@ -486,6 +579,7 @@ def getNeonBalance(client: Client, sol_account: Union[str, PublicKey]) -> int:
     return balance
 
 
+@lru_cache(maxsize=1)
 def wallet_path():
     res = solana_cli().call("config get")
     substr = "Keypair Path: "
@@ -495,16 +589,15 @@ def wallet_path():
     raise Exception("cannot get keypair path")
 
 def operator1_keypair_path():
-    res = solana_cli().call("config get")
-    substr = "Keypair Path: "
-    for line in res.splitlines():
-        if line.startswith(substr):
-            return line[len(substr):].strip()
-    raise Exception("cannot get keypair path")
+    return wallet_path()
 
 def operator2_keypair_path():
     return "/root/.config/solana/id2.json"
 
+def write_holder_layout(nonce, offset, data):
+    return WRITE_HOLDER_HEADER.pack(0x12, nonce, offset, len(data)) + data
+
+
 def send_transaction(client, trx, acc):
     result = client.send_transaction(trx, acc, opts=TxOpts(skip_confirmation=True, preflight_commitment="confirmed"))
     confirm_transaction(client, result["result"])
@@ -561,7 +654,7 @@ def create_neon_evm_instr_13_partial_call_or_continue(evm_loader_program_id,
                                           add_meta=[]):
     return TransactionInstruction(
         program_id=evm_loader_program_id,
-        data=bytearray.fromhex("0D") + collateral_pool_index_buf + step_count.to_bytes(8, byteorder='little') + evm_instruction,
+        data=STEP_INSTRUCTION_HEADER.pack(0x0D, collateral_pool_index_buf, step_count) + evm_instruction,
         keys=[
             AccountMeta(pubkey=storage_sol_acc, is_signer=False, is_writable=True),
             # System instructions account:
@@ -602,7 +695,7 @@ def create_neon_evm_instr_19_partial_call(evm_loader_program_id,
                                           add_meta=[]):
     return TransactionInstruction(
         program_id=evm_loader_program_id,
-        data=bytearray.fromhex("13") + collateral_pool_index_buf + step_count.to_bytes(8, byteorder='little') + evm_instruction,
+        data=STEP_INSTRUCTION_HEADER.pack(0x13, collateral_pool_index_buf, step_count) + evm_instruction,
         keys=[
             AccountMeta(pubkey=storage_sol_acc, is_signer=False, is_writable=True),
             # System instructions account:
@@ -640,7 +733,7 @@ def create_neon_evm_instr_20_continue(evm_loader_program_id,
                                       add_meta=[]):
     return TransactionInstruction(
         program_id=evm_loader_program_id,
-        data=bytearray.fromhex("14") + collateral_pool_index_buf + step_count.to_bytes(8, byteorder='little'),
+        data=STEP_INSTRUCTION_HEADER.pack(0x14, collateral_pool_index_buf, step_count),
         keys=[
             # Operator's storage account:
             AccountMeta(pubkey=storage_sol_acc, is_signer=False, is_writable=True),
@@ -675,7 +768,7 @@ def create_neon_evm_instr_22_begin(evm_loader_program_id,
                                    step_count):
     return TransactionInstruction(
         program_id=evm_loader_program_id,
-        data=bytearray.fromhex("16") + collateral_pool_index_buf + step_count.to_bytes(8, byteorder='little'),
+        data=STEP_INSTRUCTION_HEADER.pack(0x16, collateral_pool_index_buf, step_count),
         keys=[
             AccountMeta(pubkey=holder_sol_acc, is_signer=False, is_writable=True),
             AccountMeta(pubkey=storage_sol_acc, is_signer=False, is_writable=True),
@@ -737,7 +830,7 @@ def create_neon_evm_instr_14_combined_continue(evm_loader_program_id,
                                                step_count):
     return TransactionInstruction(
         program_id=evm_loader_program_id,
-        data=bytearray.fromhex("0E") + collateral_pool_index_buf + step_count.to_bytes(8, byteorder='little'),
+        data=STEP_INSTRUCTION_HEADER.pack(0x0E, collateral_pool_index_buf, step_count),
         keys=[
             AccountMeta(pubkey=holder_sol_acc, is_signer=False, is_writable=True),
             AccountMeta(pubkey=storage_sol_acc, is_signer=False, is_writable=True),
@@ -14,6 +14,9 @@ evm_loader_id = os.environ.get("EVM_LOADER")
 ETH_TOKEN_MINT_ID: PublicKey = PublicKey(os.environ.get("ETH_TOKEN_MINT"))
 holder_id = 0
 
+GET_CURRENT_VALUES_SELECTOR = abi.function_signature_to_4byte_selector('getCurrentValues()')
+GET_VALUES_SELECTOR = abi.function_signature_to_4byte_selector('getValues(uint256)')
+
 class BlockHashesTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -102,10 +105,10 @@ class BlockHashesTest(unittest.TestCase):
         return neon_evm_instr_05_single
 
     def make_getCurrentValues(self):
-        return abi.function_signature_to_4byte_selector('getCurrentValues()')
+        return GET_CURRENT_VALUES_SELECTOR
 
     def make_getValues(self, number: int):
-        return abi.function_signature_to_4byte_selector('getValues(uint256)')\
+        return GET_VALUES_SELECTOR\
                 + bytes.fromhex("%064x" % number)
 
     def emulate_call(self, call_data):
@@ -27,13 +27,6 @@ CREATE_ACCOUNT_LAYOUT = cStruct(
     "nonce" / Int8ul
 )
 
-def write_holder_layout(nonce, offset, data):
-    return (bytes.fromhex('12') +
-            nonce.to_bytes(8, byteorder='little') +
-            offset.to_bytes(4, byteorder='little') +
-            len(data).to_bytes(8, byteorder='little') +
-            data)
-
 class DeployTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -107,11 +100,9 @@ class DeployTest(unittest.TestCase):
         #print("msg", msg.hex())
 
         # Write transaction to transaction holder account
-        offset = 0
-        receipts = []
-        rest = msg
-        while len(rest):
-            (part, rest) = (rest[:950], rest[950:])
+        trxs = []
+        for offset in range(0, len(msg), HOLDER_MSG_SIZE):
+            part = msg[offset:offset+HOLDER_MSG_SIZE]
             trx = TransactionWithComputeBudget()
             trx.add(TransactionInstruction(program_id=evm_loader_id,
                 data=write_holder_layout(holder_id, offset, part),
@@ -119,13 +110,11 @@ class DeployTest(unittest.TestCase):
                     AccountMeta(pubkey=holder, is_signer=False, is_writable=True),
                     AccountMeta(pubkey=self.operator_acc.public_key(), is_signer=True, is_writable=False),
                 ]))
-            receipts.append(client.send_transaction(trx, self.operator_acc, opts=TxOpts(skip_confirmation=True,
-                                                                                        preflight_commitment="confirmed"))["result"])
-            offset += len(part)
+            trxs.append(trx)
+        receipts = send_multiple_transactions_unconfirmed(client, trxs, self.operator_acc)
         print("receipts", receipts)
-        for rcpt in receipts:
-            confirm_transaction(client, rcpt)
-            print("confirmed:", rcpt)
+        confirm_multiple_transactions(client, receipts)
+        print("confirmed:", receipts)
 
         base = self.operator_acc.public_key()
         seed = b58encode(ACCOUNT_SEED_VERSION+contract_eth).decode('utf8')
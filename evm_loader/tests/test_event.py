@@ -24,6 +24,7 @@ class EventTest(unittest.TestCase):
         wallet = OperatorAccount(operator1_keypair_path())
         cls.loader = EvmLoader(wallet, evm_loader_id)
         cls.acc = wallet.get_acc()
+        cls.acc_token = get_associated_token_address(PublicKey(cls.acc.public_key()), ETH_TOKEN_MINT_ID)
 
         # Create ethereum account for user account
         cls.caller_ether = eth_keys.PrivateKey(cls.acc.secret_key()).public_key.to_canonical_address()
@@ -401,14 +402,14 @@ class EventTest(unittest.TestCase):
         storage = self.create_storage_account(sign[:8].hex())
 
         caller_balance_before_cancel = self.token.balance(self.caller_token)
-        operator_balance_before_cancel = self.token.balance(get_associated_token_address(self.acc.public_key(), ETH_TOKEN_MINT_ID))
+        operator_balance_before_cancel = self.token.balance(self.acc_token)
 
         result = self.call_begin(storage, 10, msg, instruction)
         result = self.call_continue(storage, 10)
         result = self.call_cancel(storage, nonce)
 
         caller_balance_after_cancel = self.token.balance(self.caller_token)
-        operator_balance_after_cancel = self.token.balance(get_associated_token_address(self.acc.public_key(), ETH_TOKEN_MINT_ID))
+        operator_balance_after_cancel = self.token.balance(self.acc_token)
         self.assertNotEqual(caller_balance_after_cancel, caller_balance_before_cancel)
         self.assertEqual(caller_balance_before_cancel+operator_balance_before_cancel, caller_balance_after_cancel+operator_balance_after_cancel)
 
@@ -8,7 +8,6 @@ from spl.token.instructions import get_associated_token_address
 from eth_keys import keys
 from eth_utils import abi
 from web3.auto import w3
-from web3 import Web3
 
 
 solana_url = os.environ.get("SOLANA_URL", "http://localhost:8899")
@@ -25,14 +24,6 @@ def get_recent_account_balance(code_account_address):
     return http_client.get_balance(code_account_address, commitment='processed')['result']['value']
 
 
-def write_holder_layout(nonce, offset, data):
-    return (bytes.fromhex('12') +
-            nonce.to_bytes(8, byteorder='little') +
-            offset.to_bytes(4, byteorder='little') +
-            len(data).to_bytes(8, byteorder='little') +
-            data)
-
-
 def create_holder_account(operator_acc):
     holder_id_bytes = holder_id.to_bytes((holder_id.bit_length() + 7) // 8, 'big')
     seed = keccak_256(b'holder' + holder_id_bytes).hexdigest()[:32]
@@ -102,13 +93,13 @@ class EventTest(unittest.TestCase):
         print ('reId_contract_revert_eth', cls.reId_revert_eth.hex())
 
         with open(CONTRACTS_DIR+"Create_Receiver.binary", mode='rb') as file:
-            fileHash = Web3.keccak(file.read())
-            cls.reId_create_receiver_eth = bytes(Web3.keccak(b'\xff' + cls.reId_create_caller_eth + bytes(32) + fileHash)[-20:])
+            fileHash = keccak_256(file.read()).digest()
+            cls.reId_create_receiver_eth = keccak_256(b'\xff' + cls.reId_create_caller_eth + bytes(32) + fileHash).digest()[-20:]
         (cls.reId_create_receiver, _) = cls.loader.ether2program(cls.reId_create_receiver_eth)
         print ("reId_create_receiver", cls.reId_create_receiver)
         print ("reId_create_receiver_eth", cls.reId_create_receiver_eth.hex())
 
-        cls.reId_create_receiver_seed = b58encode(ACCOUNT_SEED_VERSION+bytes.fromhex(cls.reId_create_receiver_eth.hex())).decode('utf8')
+        cls.reId_create_receiver_seed = b58encode(ACCOUNT_SEED_VERSION+cls.reId_create_receiver_eth).decode('utf8')
         cls.reId_create_receiver_code_account = accountWithSeed(cls.acc.public_key(), cls.reId_create_receiver_seed, PublicKey(evm_loader_id))
 
         collateral_pool_index = 2
@@ -291,11 +282,9 @@ class EventTest(unittest.TestCase):
     def write_transaction_to_holder_account(self, holder, signature, message):
         message = signature + len(message).to_bytes(8, byteorder="little") + message
 
-        offset = 0
-        receipts = []
-        rest = message
-        while len(rest):
-            (part, rest) = (rest[:950], rest[950:])
+        trxs = []
+        for offset in range(0, len(message), HOLDER_MSG_SIZE):
+            part = message[offset:offset+HOLDER_MSG_SIZE]
             trx = TransactionWithComputeBudget()
             trx.add(TransactionInstruction(program_id=evm_loader_id,
                 data=write_holder_layout(holder_id, offset, part),
@@ -303,11 +292,10 @@ class EventTest(unittest.TestCase):
                     AccountMeta(pubkey=holder, is_signer=False, is_writable=True),
                     AccountMeta(pubkey=self.acc.public_key(), is_signer=True, is_writable=False),
                 ]))
-            receipts.append(http_client.send_transaction(trx, self.acc, opts=TxOpts(skip_confirmation=True, preflight_commitment="confirmed"))["result"])
-            offset += len(part)
+            trxs.append(trx)
 
-        for rcpt in receipts:
-            confirm_transaction(http_client, rcpt)
+        receipts = send_multiple_transactions_unconfirmed(http_client, trxs, self.acc)
+        confirm_multiple_transactions(http_client, receipts)
 
     def call_partial_signed(self, input, contract_eth, contract, code):
         tx = {'to': contract_eth, 'value': 0, 'gas': 999_999_999, 'gasPrice': 0,
@@ -408,7 +396,7 @@ class EventTest(unittest.TestCase):
         contract_nonce_pre = getTransactionCount(http_client, self.reId_caller)
 
         func_name = abi.function_signature_to_4byte_selector('callFoo(address)')
-        data = (func_name + bytes.fromhex("%024x" % 0x0 + self.reId_reciever_eth.hex()))
+        data = (func_name + bytes(12) + self.reId_reciever_eth)
         result = self.call_with_holder_account(input=data, contract_eth=self.reId_caller_eth, contract=self.reId_caller, code=self.reId_caller_code)
         print("test_01_callFoo result")
         print(result)
@@ -428,7 +416,7 @@ class EventTest(unittest.TestCase):
         count_topics = int().from_bytes(data[21:29], 'little')
         self.assertEqual(count_topics, 1)
         self.assertEqual(data[29:61], abi.event_signature_to_log_topic('Foo(address,uint256,string)'))
-        self.assertEqual(data[61:93], bytes.fromhex("%024x" %0x0 + self.reId_caller_eth.hex()))
+        self.assertEqual(data[61:93], bytes(12) + self.reId_caller_eth)
         self.assertEqual(data[93:125], bytes.fromhex("%064x" %0x0))
         self.assertEqual(data[125:157], bytes.fromhex("%062x" %0x0 + "60"))
         self.assertEqual(data[157:189], bytes.fromhex("%062x" %0x0 + "08"))
@@ -458,8 +446,8 @@ class EventTest(unittest.TestCase):
 
         func_name = abi.function_signature_to_4byte_selector('callRecover(address,address,bytes32,bytes)')
         data = (func_name +
-                bytes.fromhex("%024x" % 0x0 + self.reId_reciever_eth.hex()) +
-                bytes.fromhex("%024x" % 0x0 + self.reId_recover_eth.hex()) +
+                bytes(12) + self.reId_reciever_eth +
+                bytes(12) + self.reId_recover_eth +
                 _trx.hash() +
                 bytes.fromhex("%062x" % 0x0 + "80") +
                 bytes.fromhex("%062x" % 0x0 + "41") +
@@ -486,7 +474,7 @@ class EventTest(unittest.TestCase):
         count_topics = int().from_bytes(data[21:29], 'little')
         self.assertEqual(count_topics, 1)
         self.assertEqual(data[29:61], abi.event_signature_to_log_topic('Recovered(address)'))
-        self.assertEqual(data[61:93], bytes.fromhex("%024x" %0x0 + self.caller_ether.hex()))
+        self.assertEqual(data[61:93], bytes(12) + self.caller_ether)
 
         # emit Response_recovery_signer(success, data));
         data = b58decode(result['meta']['innerInstructions'][0]['instructions'][-3]['data'])
@@ -498,7 +486,7 @@ class EventTest(unittest.TestCase):
         self.assertEqual(data[61:93], bytes.fromhex("%062x" %0x0 + "01"))
         self.assertEqual(data[93:125], bytes.fromhex("%062x" %0x0 + "40"))
         self.assertEqual(data[125:157], bytes.fromhex("%062x" %0x0 + "20"))
-        self.assertEqual(data[157:189], bytes.fromhex("%024x" %0x0 + self.caller_ether.hex()))
+        self.assertEqual(data[157:189], bytes(12) + self.caller_ether)
 
         #  emit Result(success, data);
         data = b58decode(result['meta']['innerInstructions'][0]['instructions'][-2]['data'])
@@ -569,7 +557,7 @@ class EventTest(unittest.TestCase):
         count_topics = int().from_bytes(data[21:29], 'little')
         self.assertEqual(count_topics, 1)
         self.assertEqual(data[29:61], abi.event_signature_to_log_topic('Foo(address,uint256,string)'))
-        self.assertEqual(data[61:93], bytes.fromhex("%024x" %0x0 + self.reId_create_caller_eth.hex()))
+        self.assertEqual(data[61:93], bytes(12) + self.reId_create_caller_eth)
         self.assertEqual(data[93:125], bytes.fromhex("%064x" %0x0))
         self.assertEqual(data[125:157], bytes.fromhex("%062x" %0x0 + "60"))
         self.assertEqual(data[157:189], bytes.fromhex("%062x" %0x0 + "08"))
@@ -614,7 +602,7 @@ class EventTest(unittest.TestCase):
         count_topics = int().from_bytes(data[21:29], 'little')
         self.assertEqual(count_topics, 1)
         self.assertEqual(data[29:61], abi.event_signature_to_log_topic('Foo(address,uint256,string)'))
-        self.assertEqual(data[61:93], bytes.fromhex("%024x" %0x0 + self.reId_create_caller_eth.hex()))
+        self.assertEqual(data[61:93], bytes(12) + self.reId_create_caller_eth)
         self.assertEqual(data[93:125], bytes.fromhex("%064x" %0x0))
         self.assertEqual(data[125:157], bytes.fromhex("%062x" %0x0 + "60"))
         self.assertEqual(data[157:189], bytes.fromhex("%062x" %0x0 + "08"))
@@ -633,7 +621,7 @@ class EventTest(unittest.TestCase):
     def test_05_nested_revert(self):
         print('\ntest_05_nested_revert')
         func_name = abi.function_signature_to_4byte_selector('callFoo(address)')
-        data = (func_name + bytes.fromhex("%024x" % 0x0 + self.reId_revert_eth.hex()))
+        data = (func_name + bytes(12) + self.reId_revert_eth)
         result = self.call_with_holder_account(input=data, contract_eth=self.reId_caller_eth, contract=self.reId_caller, code=self.reId_caller_code)
         print("test_05_nested_revert result")
         print(result)
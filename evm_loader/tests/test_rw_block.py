@@ -219,8 +219,8 @@ class RW_Locking_Test(unittest.TestCase):
         instruction1 = from_addr1 + sign1 + msg1
         instruction2 = from_addr2 + sign2 + msg2
 
-        storage1 = self.create_storage_account(sign1[:8].hex(), self.acc1)
-        storage2 = self.create_storage_account(sign2[1:9].hex(), self.acc1)
+        (storage1, storage2) = create_accounts_with_seed(client, self.acc1, [sign1[:8].hex(), sign2[1:9].hex()],
+                                                         10**9, 128*1024, evm_loader_id)
 
         result = self.call_begin(storage1, 10, msg1, instruction1, False, self.acc1, self.caller1)
         result = self.call_begin(storage2, 10, msg2, instruction2, False, self.acc1, self.caller2)
@@ -266,8 +266,8 @@ class RW_Locking_Test(unittest.TestCase):
         instruction1 = from_addr1 + sign1 + msg1
         instruction2 = from_addr2 + sign2 + msg2
 
-        storage1 = self.create_storage_account(sign1[:8].hex(), self.acc1)
-        storage2 = self.create_storage_account(sign2[1:9].hex(), self.acc1)
+        (storage1, storage2) = create_accounts_with_seed(client, self.acc1, [sign1[:8].hex(), sign2[1:9].hex()],
+                                                         10**9, 128*1024, evm_loader_id)
 
         result = self.call_begin(storage1, 10, msg1, instruction1, True, self.acc1, self.caller1)
 
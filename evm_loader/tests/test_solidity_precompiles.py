@@ -15,6 +15,16 @@ evm_loader_id = os.environ.get("EVM_LOADER")
 ETH_TOKEN_MINT_ID: PublicKey = PublicKey(os.environ.get("ETH_TOKEN_MINT"))
 holder_id = 0
 
+ECRECOVER_SELECTOR = abi.function_signature_to_4byte_selector('test_01_ecrecover(bytes32, uint8, bytes32, bytes32)')
+SHA256_SELECTOR = abi.function_signature_to_4byte_selector('test_02_sha256(bytes)')
+RIPEMD160_SELECTOR = abi.function_signature_to_4byte_selector('test_03_ripemd160(bytes)')
+DATACOPY_SELECTOR = abi.function_signature_to_4byte_selector('test_04_dataCopy(bytes)')
+BIGMODEXP_SELECTOR = abi.function_signature_to_4byte_selector('test_05_bigModExp(bytes)')
+BN256ADD_SELECTOR = abi.function_signature_to_4byte_selector('test_06_bn256Add(bytes)')
+BN256SCALARMUL_SELECTOR = abi.function_signature_to_4byte_selector('test_07_bn256ScalarMul(bytes)')
+BN256PAIRING_SELECTOR = abi.function_signature_to_4byte_selector('test_08_bn256Pairing(bytes)')
+BLAKE2F_SELECTOR = abi.function_signature_to_4byte_selector('test_09_blake2F(bytes)')
+
 class PrecompilesTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -200,36 +210,23 @@ class PrecompilesTests(unittest.TestCase):
         print('neon_evm_instr_20_continue:', neon_evm_instr_20_continue)
         return neon_evm_instr_20_continue
 
-    def create_account_with_seed(self, seed):
-        storage = accountWithSeed(self.acc.public_key(), seed, PublicKey(evm_loader_id))
-
-        if getBalance(storage) == 0:
-            trx = TransactionWithComputeBudget()
-            trx.add(createAccountWithSeed(self.acc.public_key(), self.acc.public_key(), seed, 10**9, 128*1024, PublicKey(evm_loader_id)))
-            client.send_transaction(trx, self.acc, opts=TxOpts(skip_confirmation=False, preflight_commitment="confirmed"))
-
-        return storage
-
     def write_transaction_to_holder_account(self, holder, signature, message):
         message = signature + len(message).to_bytes(8, byteorder="little") + message
 
-        offset = 0
-        receipts = []
-        rest = message
-        while len(rest):
-            (part, rest) = (rest[:950], rest[950:])
+        trxs = []
+        for offset in range(0, len(message), HOLDER_MSG_SIZE):
+            part = message[offset:offset+HOLDER_MSG_SIZE]
             trx = TransactionWithComputeBudget()
             trx.add(TransactionInstruction(program_id=evm_loader_id,
-                data=(bytes.fromhex('12') + holder_id.to_bytes(8, byteorder="little") + offset.to_bytes(4, byteorder="little") + len(part).to_bytes(8, byteorder="little") + part),
+                data=write_holder_layout(holder_id, offset, part),
                 keys=[
                     AccountMeta(pubkey=holder, is_signer=False, is_writable=True),
                     AccountMeta(pubkey=self.acc.public_key(), is_signer=True, is_writable=False),
                 ]))
-            receipts.append(client.send_transaction(trx, self.acc, opts=TxOpts(skip_confirmation=True, preflight_commitment="confirmed"))["result"])
-            offset += len(part)
+            trxs.append(trx)
 
-        for rcpt in receipts:
-            confirm_transaction(client, rcpt)
+        receipts = send_multiple_transactions_unconfirmed(client, trxs, self.acc)
+        confirm_multiple_transactions(client, receipts)
 
 
     def call_with_holder_account(self, input):
@@ -241,8 +238,8 @@ class PrecompilesTests(unittest.TestCase):
 
         holder_id_bytes = holder_id.to_bytes((holder_id.bit_length() + 7) // 8, 'big')
         holder_seed = keccak_256(b'holder'+holder_id_bytes).hexdigest()[:32]
-        holder = self.create_account_with_seed(holder_seed)
-        storage = self.create_account_with_seed(sign[:8].hex())
+        (holder, storage) = create_accounts_with_seed(client, self.acc, [holder_seed, sign[:8].hex()],
+                                                      10**9, 128*1024, evm_loader_id)
 
         self.write_transaction_to_holder_account(holder, sign, msg)
 
@@ -265,55 +262,55 @@ class PrecompilesTests(unittest.TestCase):
                     return result
 
     def make_ecrecover(self, data):
-        return abi.function_signature_to_4byte_selector('test_01_ecrecover(bytes32, uint8, bytes32, bytes32)')\
+        return ECRECOVER_SELECTOR\
                 + bytes.fromhex("%062x" % 0x0 + "20") \
                 + bytes.fromhex("%064x" % len(data)) \
                 + data.to_bytes()
 
     def make_sha256(self, data):
-        return abi.function_signature_to_4byte_selector('test_02_sha256(bytes)')\
+        return SHA256_SELECTOR\
                 + bytes.fromhex("%062x" % 0x0 + "20") \
                 + bytes.fromhex("%064x" % len(data))\
                 + data
 
     def make_ripemd160(self, data):
-        return abi.function_signature_to_4byte_selector('test_03_ripemd160(bytes)')\
+        return RIPEMD160_SELECTOR\
                 + bytes.fromhex("%062x" % 0x0 + "20") \
                 + bytes.fromhex("%064x" % len(data))\
                 + data
 
     def make_callData(self, data):
-        return abi.function_signature_to_4byte_selector('test_04_dataCopy(bytes)')\
+        return DATACOPY_SELECTOR\
                 + bytes.fromhex("%062x" % 0x0 + "20") \
                 + bytes.fromhex("%064x" % len(data)) \
                 + str.encode(data)
 
     def make_bigModExp(self, data):
-        return abi.function_signature_to_4byte_selector('test_05_bigModExp(bytes)')\
+        return BIGMODEXP_SELECTOR\
                 + bytes.fromhex("%062x" % 0x0 + "20") \
                 + bytes.fromhex("%064x" % len(data)) \
                 + data
 
     def make_bn256Add(self, data):
-        return abi.function_signature_to_4byte_selector('test_06_bn256Add(bytes)')\
+        return BN256ADD_SELECTOR\
                 + bytes.fromhex("%062x" % 0x0 + "20") \
                 + bytes.fromhex("%064x" % len(data)) \
                 + data
 
     def make_bn256ScalarMul(self, data):
-        return abi.function_signature_to_4byte_selector('test_07_bn256ScalarMul(bytes)')\
+        return BN256SCALARMUL_SELECTOR\
                 + bytes.fromhex("%062x" % 0x0 + "20") \
                 + bytes.fromhex("%064x" % len(data)) \
                 + data
 
     def make_bn256Pairing(self, data):
-        return abi.function_signature_to_4byte_selector('test_08_bn256Pairing(bytes)')\
+        return BN256PAIRING_SELECTOR\
                 + bytes.fromhex("%062x" % 0x0 + "20") \
                 + bytes.fromhex("%064x" % len(data)) \
                 + data
 
     def make_blake2F(self, data):
-        return abi.function_signature_to_4byte_selector('test_09_blake2F(bytes)')\
+        return BLAKE2F_SELECTOR\
                 + bytes.fromhex("%062x" % 0x0 + "20") \
                 + bytes.fromhex("%064x" % len(data)) \
                 + data
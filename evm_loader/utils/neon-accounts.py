@@ -5,27 +5,27 @@
 ## Prints Ethereum accounts owned by the Neon EVM program.
 ## If executed with 'migrate' argument, performs the
 ## migration from V1-accounts to the current version.
+## Migrations run in parallel, MIGRATE_WORKERS sets the number of workers.
 
 import base64
-import io
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from solana.rpc.api import Client
 
 SOLANA_URL = os.environ.get("SOLANA_URL", "http://solana:8899")
 EVM_LOADER = os.environ.get("EVM_LOADER", "53DfF883gyixYNXnM7s5xhdeyV8mVk9T4i2hGV9vG9io")
+MIGRATE_WORKERS = int(os.environ.get("MIGRATE_WORKERS", "8"))
 
-def do_migrate(address: str) -> None:
-    cli = subprocess.Popen(["neon-cli-v2", "migrate-account", address,
-                            "--url", SOLANA_URL, "--evm_loader", EVM_LOADER],
-                           stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-    with io.TextIOWrapper(cli.stdout, encoding="utf-8") as out:
-        for line in out:
-            print(line.strip())
+def do_migrate(address: str) -> str:
+    cli = subprocess.run(["neon-cli-v2", "migrate-account", address,
+                          "--url", SOLANA_URL, "--evm_loader", EVM_LOADER],
+                         stdout=subprocess.PIPE, stderr=subprocess.STDOUT, encoding="utf-8")
+    return cli.stdout
 
-def process(account: object, command: str) -> (int, int):
+def process(account: object, to_migrate: list) -> (int, int):
     result = (0, 0)
 
     data = account["data"]
@@ -43,8 +43,7 @@ def process(account: object, command: str) -> (int, int):
 
     if tag == 1:
         print("V1:", address)
-        if command == "migrate":
-            do_migrate(address)
+        to_migrate.append(address)
         result = (1, 0)
     elif tag == 10:
         print("V2:", address)
@@ -61,10 +60,18 @@ def main():
     response = client.get_program_accounts(EVM_LOADER, encoding="jsonParsed")
 
     count = (0, 0)
+    to_migrate = []
     for account in response["result"]:
-        r = process(account["account"], command)
+        r = process(account["account"], to_migrate)
         count = (count[0] + r[0], count[1] + r[1])
 
+    if command == "migrate" and to_migrate:
+        # neon-cli runs are independent and I/O bound, print each output as a whole
+        with ThreadPoolExecutor(max_workers=MIGRATE_WORKERS) as executor:
+            for output in executor.map(do_migrate, to_migrate):
+                for line in output.splitlines():
+                    print(line.strip())
+
     print()
     print("Total Ethereum accounts V1:", count[0])
     print("Total Ethereum accounts V2:", count[1])